@@ -1,4 +1,4 @@
-from flask import Flask, render_template, request, send_from_directory, jsonify
+from flask import Flask, render_template, request, send_from_directory, jsonify, Response, stream_with_context, url_for
 import os
 import json
 import time
@@ -13,9 +13,27 @@ CONFIG_PATH = os.path.join(os.path.dirname(__file__), 'config.json')
 with open(CONFIG_PATH, 'r') as f:
     config = json.load(f)
 
-# 2) Import Monet & Renoir modules
-from monet_V0_8.Monet_V0_8 import generate_background_image as monet_generate
-from renoir_V0_1.Renoir_V0_1 import generate_progressive_images as renoir_generate
+# 2) Load Monet & Renoir engines named in config (use_new_monet / use_renoir)
+import compositor
+from renderer_registry import ENGINES, load_renderers
+
+load_renderers(config)  # import the configured engines at startup, not on first request
+
+def _engine_overrides():
+    """
+    Per-request engine choice for A/B runs, e.g.
+    /preview?child_name=Leah&monet_engine=monet_v0_7_module
+    """
+    overrides = {}
+    for role in ("monet", "renoir"):
+        engine_key = request.args.get(f"{role}_engine")
+        if engine_key:
+            overrides[role] = engine_key
+    return overrides
+
+def _engines_label(renderers):
+    modules = [r["module_path"] for r in renderers.values() if r]
+    return "Monet & Renoir Combined (" + " + ".join(modules) + ")"
 
 @app.route('/')
 def personalize():
@@ -24,15 +42,23 @@ def personalize():
 @app.route('/preview')
 def preview():
     """
-    Generates:
+    Renders the preview page straight away. By default the images are
+    streamed in afterwards from /preview-stream, so step 1 shows up while
+    later steps are still rendering.
+
+    With ?stream=0 the page is rendered the old way:
       - One Monet image: Background_<child_name>.png
       - Multiple Renoir images: Renoir_<child_name>_step1..stepX.png
-    Displays all on the preview page.
+    all generated before the response is sent.
     """
     child_name = request.args.get('child_name', '').strip()
     gender = request.args.get('gender', '')
     character = request.args.get('character', '')
     nb_letters = len(child_name)
+    use_stream = request.args.get('stream', '1') != '0'
+    overrides = _engine_overrides()
+    renderers = load_renderers(config, overrides)
+    monet, renoir = renderers["monet"], renderers["renoir"]
 
     monet_filename = None
     renoir_image_list = []
@@ -40,23 +66,31 @@ def preview():
     monet_cpu_usage = 0.0
     renoir_execution_time = 0.0
     renoir_cpu_usage = 0.0
+    stream_url = None
+
+    if child_name and use_stream:
+        stream_url = url_for('preview_stream', child_name=child_name,
+                             **{f"{role}_engine": key for role, key in overrides.items()})
+    elif child_name:
+        # Glyph picks are planned once and shared by both engines
+        picks = compositor.plan_glyph_picks(child_name)
 
-    if child_name:
         # Generate Monet's image with metrics
         proc = psutil.Process()
         proc.cpu_percent(interval=None)  # Initialize CPU measurement
         start_monet = time.time()
-        monet_generate(child_name, config)
+        monet["generate"](child_name, config, picks)
         monet_execution_time = time.time() - start_monet
         monet_cpu_usage = proc.cpu_percent(interval=None)
         monet_filename = f"Background_{child_name}.png"
 
         # Generate Renoir's images with metrics
-        proc.cpu_percent(interval=None)  # Reset for Renoir
-        start_renoir = time.time()
-        renoir_image_list = renoir_generate(child_name, config)
-        renoir_execution_time = time.time() - start_renoir
-        renoir_cpu_usage = proc.cpu_percent(interval=None)
+        if renoir:
+            proc.cpu_percent(interval=None)  # Reset for Renoir
+            start_renoir = time.time()
+            renoir_image_list = renoir["generate"](child_name, config, picks)
+            renoir_execution_time = time.time() - start_renoir
+            renoir_cpu_usage = proc.cpu_percent(interval=None)
 
     return render_template(
         'preview.html',
@@ -66,21 +100,95 @@ def preview():
         nb_letters=nb_letters,
         monet_filename=monet_filename,
         renoir_image_list=renoir_image_list,
-        monet_version="Monet & Renoir Combined",
+        monet_version=_engines_label(renderers),
+        monet_engine_key=monet["key"],
         branch_version=config.get("branch", "N/A"),
         monet_execution_time=monet_execution_time,
         monet_cpu_usage=monet_cpu_usage,
         renoir_execution_time=renoir_execution_time,
-        renoir_cpu_usage=renoir_cpu_usage
+        renoir_cpu_usage=renoir_cpu_usage,
+        stream_url=stream_url
     )
 
+def _sse_event(event, data):
+    """Formats one server-sent event with a JSON payload."""
+    return f"event: {event}\ndata: {json.dumps(data)}\n\n"
+
+@app.route('/preview-stream')
+def preview_stream():
+    """
+    Server-sent events feed for the preview page.
+    Emits one 'renoir' event per progressive step as soon as it is saved,
+    then a 'monet' event for the final image, then a 'done' event
+    carrying the same metrics the synchronous preview shows.
+    """
+    child_name = request.args.get('child_name', '').strip()
+    renderers = load_renderers(config, _engine_overrides())
+    monet, renoir = renderers["monet"], renderers["renoir"]
+
+    def image_event(role, filename, step=None):
+        if role == "renoir":
+            return _sse_event('renoir', {
+                "step": step,
+                "filename": filename,
+                "url": url_for('serve_preview_image', filename=filename)
+            })
+        return _sse_event('monet', {
+            "filename": filename,
+            "url": url_for('serve_preview_image', filename=filename, engine=monet["key"])
+        })
+
+    def generate():
+        if not child_name:
+            yield _sse_event('done', {})
+            return
+
+        # Glyph picks are planned once and shared by both engines
+        picks = compositor.plan_glyph_picks(child_name)
+        proc = psutil.Process()
+
+        # Renoir first: these are shown first on the page
+        renoir_execution_time = 0.0
+        renoir_cpu_usage = 0.0
+        if renoir:
+            proc.cpu_percent(interval=None)
+            start_renoir = time.time()
+            for step_index, filename in renoir["iterate"](child_name, config, picks):
+                yield image_event('renoir', filename, step_index)
+            renoir_execution_time = time.time() - start_renoir
+            renoir_cpu_usage = proc.cpu_percent(interval=None)
+
+        proc.cpu_percent(interval=None)
+        start_monet = time.time()
+        monet["generate"](child_name, config, picks)
+        monet_execution_time = time.time() - start_monet
+        monet_cpu_usage = proc.cpu_percent(interval=None)
+        yield image_event('monet', f"Background_{child_name}.png")
+
+        yield _sse_event('done', {
+            "monet_execution_time": monet_execution_time,
+            "monet_cpu_usage": monet_cpu_usage,
+            "renoir_execution_time": renoir_execution_time,
+            "renoir_cpu_usage": renoir_cpu_usage
+        })
+
+    response = Response(stream_with_context(generate()), mimetype='text/event-stream')
+    # Stop proxies (e.g. nginx in front of gunicorn) from buffering the stream
+    response.headers['Cache-Control'] = 'no-cache'
+    response.headers['X-Accel-Buffering'] = 'no'
+    return response
+
 @app.route('/preview-image/<filename>')
 def serve_preview_image(filename):
     """
     Serve both Monet and Renoir images from different folders using 
-    the same route. We'll guess which folder by the filename.
+    the same route. ?engine=<config key> picks that engine's output folder;
+    otherwise we'll guess which folder by the filename.
     """
-    if filename.startswith("Renoir_"):
+    engine_key = request.args.get('engine')
+    if engine_key in ENGINES:
+        folder = config["paths"][ENGINES[engine_key]["output"]]
+    elif filename.startswith("Renoir_"):
         folder = config["paths"]["renoir_output"]
     else:
         folder = config["paths"]["new_output"]
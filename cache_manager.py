@@ -1,7 +1,10 @@
 import os
 import time
+from concurrent.futures import ThreadPoolExecutor
 from PIL import Image
 
+import compositor
+
 _renoir_backgrounds = {}
 _renoir_letter_variations = {}
 
@@ -12,6 +15,8 @@ _caching_info = {
     "is_cached": False,
     "total_images": 0,
     "time_seconds": 0.0,
+    "decode_workers": 0,
+    "folder_timings": {},
     "validation_report": []
 }
 
@@ -23,18 +28,38 @@ def init_cache(config):
         return _caching_info
 
     start_time = time.time()
-    print("[Info] Starting cache initialization...")
-
-    renoir_count = _preload_renoir_assets(config)
-    monet_count = _preload_monet_assets(config)
+    workers = _decode_worker_count(config)
+    print(f"[Info] Starting cache initialization with {workers} decode threads...")
+
+    # Pillow releases the GIL while decoding/converting PNGs, so every file of
+    # every folder is queued on one pool and decoded in parallel. Results are
+    # stored back in listdir order so variation cycling stays deterministic.
+    # Files shared by several folders in config (Monet reads Renoir's letter
+    # sets) are decoded once, so both caches hold the very same images.
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        submitted = {}
+        jobs = (_preload_renoir_assets(config, executor, submitted)
+                + _preload_monet_assets(config, executor, submitted))
+        folder_timings = {}
+        total_images = 0
+        collected = set()
+        for job in jobs:
+            loaded, timing = _collect_folder_job(job, start_time, collected)
+            folder_timings[job["label"]] = timing
+            total_images += loaded
+
+    # The caches are final now: index the letter variations once for the engines
+    compositor.build_variation_index(_renoir_letter_variations)
+    compositor.build_variation_index(_monet_letter_variations)
 
     end_time = time.time()
     duration = end_time - start_time
 
-    total_images = renoir_count + monet_count
     _caching_info["is_cached"] = True
     _caching_info["total_images"] = total_images
     _caching_info["time_seconds"] = round(duration, 2)
+    _caching_info["decode_workers"] = workers
+    _caching_info["folder_timings"] = folder_timings
 
     # Build the validation report
     _caching_info["validation_report"] = _validate_caching()
@@ -42,29 +67,23 @@ def init_cache(config):
     print(f"[Info] Caching complete. {total_images} images loaded in {duration:.2f} seconds.")
     return _caching_info
 
-def _preload_renoir_assets(config):
-    count = 0
+def _decode_worker_count(config):
+    """
+    Number of threads used to decode assets. Taken from
+    config["cache_decode_workers"]; falls back to the CPU count.
+    """
+    workers = config.get("cache_decode_workers") or os.cpu_count() or 1
+    return max(1, int(workers))
+
+def _preload_renoir_assets(config, executor, submitted):
+    """
+    Queues the Renoir backgrounds and both letter sets on `executor`.
+    Returns the pending folder jobs; see _collect_folder_job().
+    """
     background_dir = os.path.join(
         os.path.dirname(__file__),
         config["paths"]["renoir_background_dir"]
     )
-    print(f"[Debug] Renoir background_dir: {background_dir}")
-
-    if os.path.exists(background_dir):
-        files_in_bg_dir = os.listdir(background_dir)
-        print(f"[Debug] Files in renoir background_dir: {files_in_bg_dir}")
-        for fname in files_in_bg_dir:
-            if fname.lower().endswith(".png") and fname.startswith("Background"):
-                path = os.path.join(background_dir, fname)
-                try:
-                    _renoir_backgrounds[fname] = Image.open(path).convert("RGBA")
-                    count += 1
-                    print(f"[Debug] Loaded Renoir background: {fname}")
-                except Exception as e:
-                    print(f"[Warning] Could not open Renoir background {fname}: {e}")
-    else:
-        print("[Warning] renoir_background_dir does not exist or is inaccessible.")
-
     normal_letters_path = os.path.join(
         os.path.dirname(__file__),
         config["paths"]["renoir_letters_normal"]
@@ -74,36 +93,23 @@ def _preload_renoir_assets(config):
         config["paths"]["renoir_letters_small"]
     )
 
-    print(f"[Debug] Renoir normal_letters_path: {normal_letters_path}")
-    _debug_preload_letter_folder(normal_letters_path, _renoir_letter_variations, "[Renoir Normal]")
+    return [
+        _submit_folder_job(executor, submitted, "[Renoir Backgrounds]", background_dir, _renoir_backgrounds,
+                           as_variations=False,
+                           accept=lambda fname: fname.startswith("Background")),
+        _submit_folder_job(executor, submitted, "[Renoir Normal]", normal_letters_path, _renoir_letter_variations),
+        _submit_folder_job(executor, submitted, "[Renoir Small]", small_letters_path, _renoir_letter_variations),
+    ]
 
-    print(f"[Debug] Renoir small_letters_path: {small_letters_path}")
-    _debug_preload_letter_folder(small_letters_path, _renoir_letter_variations, "[Renoir Small]")
-
-    count += _debug_preload_letter_folder(normal_letters_path, _renoir_letter_variations,
-                                          count_label="[Renoir Normal]", do_load=True)
-    count += _debug_preload_letter_folder(small_letters_path, _renoir_letter_variations,
-                                          count_label="[Renoir Small]", do_load=True)
-    return count
-
-def _preload_monet_assets(config):
-    count = 0
+def _preload_monet_assets(config, executor, submitted):
+    """
+    Queues the Monet background and both letter sets on `executor`.
+    Returns the pending folder jobs; see _collect_folder_job().
+    """
     bg_path = os.path.join(
         os.path.dirname(__file__),
         config["paths"]["new_background"]
     )
-    print(f"[Debug] Monet background path: {bg_path}")
-
-    if os.path.exists(bg_path):
-        try:
-            _monet_backgrounds["Background.png"] = Image.open(bg_path).convert("RGBA")
-            count += 1
-            print("[Debug] Loaded Monet background: Background.png")
-        except Exception as e:
-            print(f"[Warning] Could not open Monet background: {e}")
-    else:
-        print("[Warning] Monet background path does not exist or is inaccessible.")
-
     normal_letters_path = os.path.join(
         os.path.dirname(__file__),
         config["paths"]["letters_normal"]
@@ -113,37 +119,111 @@ def _preload_monet_assets(config):
         config["paths"]["letters_small"]
     )
 
-    print(f"[Debug] Monet normal_letters_path: {normal_letters_path}")
-    print(f"[Debug] Monet small_letters_path: {small_letters_path}")
+    bg_job = {
+        "label": "[Monet Background]",
+        "folder": os.path.dirname(bg_path),
+        "target": _monet_backgrounds,
+        "as_variations": False,
+        "pending": []
+    }
+    if os.path.exists(bg_path):
+        bg_job["pending"].append(("Background.png", _submit_decode(executor, submitted, bg_path)))
+    else:
+        print("[Warning] Monet background path does not exist or is inaccessible.")
 
-    count += _debug_preload_letter_folder(normal_letters_path, _monet_letter_variations,
-                                          count_label="[Monet Normal]", do_load=True)
-    count += _debug_preload_letter_folder(small_letters_path, _monet_letter_variations,
-                                          count_label="[Monet Small]", do_load=True)
-    return count
+    return [
+        bg_job,
+        _submit_folder_job(executor, submitted, "[Monet Normal]", normal_letters_path, _monet_letter_variations),
+        _submit_folder_job(executor, submitted, "[Monet Small]", small_letters_path, _monet_letter_variations),
+    ]
 
-def _debug_preload_letter_folder(folder_path, variations_dict, count_label="", do_load=False):
-    loaded_count = 0
+def _decode_image(path):
+    """Runs on a pool thread: decodes one PNG and times it."""
+    start = time.perf_counter()
+    img = Image.open(path).convert("RGBA")
+    return img, time.perf_counter() - start
+
+def _submit_decode(executor, submitted, path):
+    """
+    Queues one decode, or reuses the pending one if another folder job
+    already asked for the same file. `submitted` maps real path -> future.
+    """
+    key = os.path.realpath(path)
+    if key not in submitted:
+        submitted[key] = executor.submit(_decode_image, path)
+    return submitted[key]
+
+def _submit_folder_job(executor, submitted, label, folder_path, target, as_variations=True, accept=None):
+    """
+    Submits one decode task per PNG in `folder_path`.
+    With as_variations=True, images are appended to a list per filename
+    (letter caches); otherwise each filename maps to one image (backgrounds).
+    """
+    job = {
+        "label": label,
+        "folder": folder_path,
+        "target": target,
+        "as_variations": as_variations,
+        "pending": []
+    }
     if not os.path.exists(folder_path):
-        print(f"{count_label} [Warning] Path does not exist: {folder_path}")
-        return 0
-
-    files_in_folder = os.listdir(folder_path)
-    print(f"{count_label} [Debug] Files in {folder_path}: {files_in_folder}")
-
-    if do_load:
-        for fname in files_in_folder:
-            if fname.lower().endswith(".png"):
-                fullpath = os.path.join(folder_path, fname)
-                try:
-                    img = Image.open(fullpath).convert("RGBA")
-                    variations_dict.setdefault(fname, []).append(img)
-                    loaded_count += 1
-                    print(f"{count_label} [Debug] Loaded letter image: {fname}")
-                except Exception as e:
-                    print(f"{count_label} [Warning] Could not open letter {fname}: {e}")
-
-    return loaded_count
+        print(f"{label} [Warning] Path does not exist: {folder_path}")
+        return job
+
+    for fname in os.listdir(folder_path):
+        if not fname.lower().endswith(".png"):
+            continue
+        if accept and not accept(fname):
+            continue
+        fullpath = os.path.join(folder_path, fname)
+        job["pending"].append((fname, _submit_decode(executor, submitted, fullpath)))
+    return job
+
+def _collect_folder_job(job, cache_start_time, collected):
+    """
+    Waits for a folder's decode tasks and stores the images in its cache dict.
+    Prints one aggregated debug line per folder instead of one per file.
+    Returns (loaded_count, timing) where timing holds the image count, how
+    many were shared with an earlier folder, the summed per-file decode time
+    (shared files are only counted once) and how long after cache start the
+    folder was fully loaded. `collected` tracks futures already consumed.
+    """
+    label = job["label"]
+    loaded_count = 0
+    decode_seconds = 0.0
+    shared_count = 0
+    failed = []
+
+    for fname, future in job["pending"]:
+        try:
+            img, elapsed = future.result()
+        except Exception as e:
+            failed.append(fname)
+            print(f"{label} [Warning] Could not open {fname}: {e}")
+            continue
+        if job["as_variations"]:
+            job["target"].setdefault(fname, []).append(img)
+        else:
+            job["target"][fname] = img
+        loaded_count += 1
+        if id(future) in collected:
+            shared_count += 1
+        else:
+            collected.add(id(future))
+            decode_seconds += elapsed
+
+    ready_seconds = time.time() - cache_start_time
+    print(f"{label} [Debug] Loaded {loaded_count} images from {job['folder']} "
+          f"({shared_count} shared, {decode_seconds:.2f}s decode time, {len(failed)} failed)")
+
+    timing = {
+        "images": loaded_count,
+        "shared": shared_count,
+        "failed": len(failed),
+        "decode_seconds": round(decode_seconds, 3),
+        "ready_seconds": round(ready_seconds, 3)
+    }
+    return loaded_count, timing
 
 def _validate_caching():
     """
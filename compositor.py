@@ -0,0 +1,185 @@
+import re
+
+# Shared layout-and-composite core used by every engine that renders from the
+# in-memory caches (Monet V0_8, Renoir V0_1). Engines only decide *what* to
+# draw (background, which prefix of the name); the variation lookup, glyph
+# picks, spacing and centring all live here so A/B runs use identical maths.
+
+# Letter filenames look like "A.png", "A2.png", "A_small.png", "hyphen3_small.png"
+_LETTER_FILENAME = re.compile(r"^(?P<base>hyphen|[A-Z])(?P<number>\d*)(?P<small>_small)?\.png$")
+
+# id(letter_variations) -> index, built by cache_manager.init_cache()
+_variation_indexes = {}
+
+# zlib level for preview PNGs. Encoding is nearly all of a request's CPU
+# (~0.27s per 1280x640 image at Pillow's default 6, ~0.08s at 1 as RGB)
+# while files only grow by a few percent.
+DEFAULT_PNG_COMPRESS_LEVEL = 1
+
+
+def glyph_base(char):
+    """Maps a name character to its letter filename prefix ('-' -> 'hyphen')."""
+    return "hyphen" if char == '-' else char.upper()
+
+
+def uses_small_letters(name_length):
+    """Names of 8..12 characters use the small letter set."""
+    return 8 <= name_length <= 12
+
+
+def letter_spacing(config, name_length):
+    """Spacing in px between letters for a name (or prefix) of this length."""
+    spacing_dict = config.get("letter_spacing_per_length", {})
+    default_spacing = config.get("default_letter_spacing_px", 0)
+    return spacing_dict.get(str(name_length), default_spacing)
+
+
+def get_variation_index(letter_variations):
+    """
+    Returns {(base, use_small): [PIL images in variation order]} for a letter
+    cache such as cache_manager._renoir_letter_variations.
+
+    The index is built by build_variation_index() once init_cache() has
+    filled the caches, so engines never rescan the cache per letter. It is
+    only built here if an engine runs before the cache was initialised.
+    """
+    index = _variation_indexes.get(id(letter_variations))
+    if index is None:
+        index = build_variation_index(letter_variations)
+    return index
+
+
+def build_variation_index(letter_variations):
+    """
+    (Re)builds and stores the variation index of a letter cache.
+    Variation order is A.png, A2.png, A3.png, ... (no number sorts first),
+    the order Renoir V0_1 always used. Monet V0_8 used to cycle in
+    os.listdir() order, which differs between filesystems (e.g. L3.png
+    before L.png), so its output changed when it moved onto this index.
+    Call it whenever the cache contents change.
+    """
+    numbered = {}
+    for fname, pil_list in letter_variations.items():
+        match = _LETTER_FILENAME.match(fname)
+        if not match:
+            continue
+        key = (match.group("base"), bool(match.group("small")))
+        number = int(match.group("number") or 0)
+        numbered.setdefault(key, []).append((number, fname, pil_list))
+
+    index = {}
+    for key, entries in numbered.items():
+        entries.sort(key=lambda entry: (entry[0], entry[1]))
+        index[key] = [img for _, _, pil_list in entries for img in pil_list]
+
+    _variation_indexes[id(letter_variations)] = index
+    return index
+
+
+def plan_glyph_picks(child_name):
+    """
+    Picks a variation for every character of the name, once per request.
+    Returns a list of (base, variation_number): the n-th occurrence of a
+    character uses its n-th variation, cycling when the letter has fewer
+    variations than occurrences.
+
+    Occurrences are counted per raw character, the way Monet V0_8's
+    variations_cache was keyed: 'A' and 'a' share images but cycle
+    separately, so "Anna" uses its first A variation twice. Which image is
+    "first" follows build_variation_index(), not Monet's old listdir order.
+
+    Picks are independent of the letter set, so the same plan is used for
+    the full name (Monet) and every prefix of it (Renoir).
+    """
+    occurrences = {}
+    picks = []
+    for ch in child_name:
+        number = occurrences.get(ch, 0)
+        occurrences[ch] = number + 1
+        picks.append((glyph_base(ch), number))
+    return picks
+
+
+def resolve_picks(variation_index, picks, use_small):
+    """
+    Resolves glyph picks to cached images for the given letter set.
+    Characters without any image give None (with a warning) and are skipped
+    when drawing, as before. The returned images are the cached originals:
+    composite them, never mutate them.
+    """
+    images = []
+    for base, number in picks:
+        variations = variation_index.get((base, use_small))
+        if not variations:
+            print(f"[Warning] No images found for character '{base}'. Skipping.")
+            images.append(None)
+            continue
+        images.append(variations[number % len(variations)])
+    return images
+
+
+def layout_positions(images, spacing, canvas_width):
+    """
+    Horizontally centres a strip of letter images on a canvas.
+    Returns the x offset of every image (all letters sit at y=0).
+    """
+    total_width = sum(img.width for img in images) + spacing * (len(images) - 1)
+    current_x = (canvas_width - total_width) // 2
+    positions = []
+    for img in images:
+        positions.append(current_x)
+        current_x += img.width + spacing
+    return positions
+
+
+def composite_letters(background, images, positions):
+    """Alpha-composites the letters onto `background` in place."""
+    for img, x in zip(images, positions):
+        background.alpha_composite(img, dest=(x, 0))
+    return background
+
+
+def render_jobs(jobs, picks, config):
+    """
+    Renders and saves the outputs an engine planned (plan_background_image,
+    plan_progressive_images).
+    Each job is a dict with:
+      - filename, output_path
+      - background:      cached background image (never mutated)
+      - variation_index: get_variation_index() of the engine's letter cache
+      - length:          how many picks to draw (len(name) or a prefix)
+
+    Picks are resolved to glyphs once per letter set, not once per job.
+    Jobs are composited and saved one after the other, in order, and each
+    job is yielded as soon as its file is written, so the first output
+    never waits on later ones. Jobs with no drawable letter are skipped.
+    """
+    resolved = {}   # (id(variation_index), use_small) -> [image or None per pick]
+    compress_level = config.get("preview_png_compress_level", DEFAULT_PNG_COMPRESS_LEVEL)
+
+    for job in jobs:
+        length = job["length"]
+        use_small = uses_small_letters(length)
+        resolve_key = (id(job["variation_index"]), use_small)
+        if resolve_key not in resolved:
+            resolved[resolve_key] = resolve_picks(job["variation_index"], picks, use_small)
+        glyphs = [img for img in resolved[resolve_key][:length] if img is not None]
+        if not glyphs:
+            continue
+
+        spacing = letter_spacing(config, length)
+        positions = layout_positions(glyphs, spacing, job["background"].width)
+        image = composite_letters(job["background"].copy(), glyphs, positions)
+        save_preview(image, job["output_path"], compress_level)
+        yield job
+
+
+def save_preview(image, output_path, compress_level=DEFAULT_PNG_COMPRESS_LEVEL):
+    """
+    Saves a composited preview as PNG. The spreads are fully opaque, so the
+    alpha channel is dropped when it carries nothing: same pixels, a quarter
+    less data to compress.
+    """
+    if image.mode == "RGBA" and image.getchannel("A").getextrema() == (255, 255):
+        image = image.convert("RGB")
+    image.save(output_path, compress_level=compress_level)
@@ -0,0 +1,90 @@
+import importlib
+import inspect
+
+# Engines the app can load, keyed by the config key holding their module path.
+#   role   : which preview slot the engine fills
+#   output : config["paths"] key of the folder the engine saves into, relative
+#            to the app root; /preview-image serves that engine's files from it
+ENGINES = {
+    "monet_v0_7_module": {"role": "monet", "output": "old_output"},
+    "monet_v0_8_module": {"role": "monet", "output": "new_output"},
+    "renoir_v0_1_module": {"role": "renoir", "output": "renoir_output"},
+}
+
+# module path -> imported module
+_loaded_modules = {}
+
+
+def select_engine_keys(config, overrides=None):
+    """
+    Picks the engine config key for each role from the config flags:
+      - use_new_monet: Monet V0_8 if true, else Monet V0_7
+      - use_renoir:    Renoir V0_1 if true, else no Renoir output
+    `overrides` ({role: engine_key}) lets a single request A/B another
+    registered engine without touching config.json.
+    """
+    keys = {
+        "monet": "monet_v0_8_module" if config.get("use_new_monet") else "monet_v0_7_module",
+        "renoir": "renoir_v0_1_module" if config.get("use_renoir") else None,
+    }
+    for role, engine_key in (overrides or {}).items():
+        if engine_key in ENGINES and ENGINES[engine_key]["role"] == role:
+            keys[role] = engine_key
+    return keys
+
+
+def load_renderers(config, overrides=None):
+    """
+    Imports the selected engines and returns {role: renderer} where each
+    renderer is a dict with:
+      - key, module_path
+      - generate(child_name, config, picks=None)
+      - iterate(child_name, config, picks=None)   (Renoir only, yields (step, filename))
+    Roles that are switched off map to None.
+    """
+    renderers = {}
+    for role, engine_key in select_engine_keys(config, overrides).items():
+        renderers[role] = _build_renderer(engine_key, config) if engine_key else None
+    return renderers
+
+
+def _import_engine(module_path):
+    if module_path not in _loaded_modules:
+        _loaded_modules[module_path] = importlib.import_module(module_path)
+    return _loaded_modules[module_path]
+
+
+def _build_renderer(engine_key, config):
+    module_path = config[engine_key]
+    module = _import_engine(module_path)
+    spec = ENGINES[engine_key]
+
+    renderer = {
+        "key": engine_key,
+        "module_path": module_path,
+    }
+    if spec["role"] == "monet":
+        renderer["generate"] = _adapt(module.generate_background_image)
+    else:
+        renderer["generate"] = _adapt(module.generate_progressive_images)
+        renderer["iterate"] = _adapt(module.iter_progressive_images)
+    return renderer
+
+
+def _adapt(func):
+    """
+    Gives every engine entry point the (child_name, config, picks=None)
+    signature. Older engines that predate the shared compositor core
+    (e.g. Monet V0_7) ignore the arguments they do not take.
+    """
+    params = inspect.signature(func).parameters
+
+    def call(child_name, config, picks=None):
+        kwargs = {}
+        if "config" in params:
+            kwargs["config"] = config
+        if "picks" in params:
+            kwargs["picks"] = picks
+        return func(child_name, **kwargs)
+
+    return call
@@ -0,0 +1,54 @@
+document.addEventListener("DOMContentLoaded", function () {
+  const configEl = document.getElementById('preview-stream-config');
+  if (!configEl || !window.EventSource) {
+    return;
+  }
+
+  const renoirTitle = document.getElementById('renoir-stream-title');
+  const renoirContainer = document.getElementById('renoir-stream');
+  const monetTitle = document.getElementById('monet-stream-title');
+  const monetContainer = document.getElementById('monet-stream');
+
+  function appendImage(container, url, altText) {
+    const wrapper = document.createElement('div');
+    wrapper.style.marginBottom = '20px';
+    const img = document.createElement('img');
+    img.className = 'generated-preview-img';
+    img.src = url;
+    img.alt = altText;
+    wrapper.appendChild(img);
+    container.appendChild(wrapper);
+  }
+
+  const source = new EventSource(configEl.getAttribute('data-stream-url'));
+
+  // One event per Renoir step, sent as soon as that step is saved
+  source.addEventListener('renoir', function (e) {
+    const data = JSON.parse(e.data);
+    renoirTitle.style.display = '';
+    appendImage(renoirContainer, data.url, 'Renoir Partial Image');
+  });
+
+  source.addEventListener('monet', function (e) {
+    const data = JSON.parse(e.data);
+    monetTitle.style.display = '';
+    appendImage(monetContainer, data.url, 'Monet Preview Image');
+  });
+
+  // Final metrics; close so the browser does not reconnect and re-render
+  source.addEventListener('done', function (e) {
+    const data = JSON.parse(e.data);
+    if (data.monet_execution_time !== undefined) {
+      document.getElementById('monet-execution-time').textContent = data.monet_execution_time.toFixed(2);
+      document.getElementById('monet-cpu-usage').textContent = data.monet_cpu_usage.toFixed(1);
+      document.getElementById('renoir-execution-time').textContent = data.renoir_execution_time.toFixed(2);
+      document.getElementById('renoir-cpu-usage').textContent = data.renoir_cpu_usage.toFixed(1);
+    }
+    source.close();
+  });
+
+  source.onerror = function (err) {
+    console.warn('Preview stream error:', err);
+    source.close();
+  };
+});